@@ -6,7 +6,28 @@ from .models import (Address, BoardGame, Client, Club, ClubAddress, ClubClient,
                      ClubToGame, GameGenre, GameSet, Genre, SetToGame)
 
 
-class ClubToGameInline(admin.TabularInline):
+class RelatedInline(admin.TabularInline):
+    """Inline class joining the related rows of a through model.
+
+    Args:
+        admin: django admin
+    """
+
+    related = ()
+
+    def get_queryset(self, request):
+        """Select related objects in the same query as the inline rows.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            QuerySet: inline rows with related objects
+        """
+        return super().get_queryset(request).select_related(*self.related)
+
+
+class ClubToGameInline(RelatedInline):
     """Inline class for ClubToGame.
 
     Args:
@@ -14,10 +35,11 @@ class ClubToGameInline(admin.TabularInline):
     """
 
     model = ClubToGame
+    related = ('club', 'game')
     extra = 1
 
 
-class SetToGameInline(admin.TabularInline):
+class SetToGameInline(RelatedInline):
     """Inline class for SetToGame.
 
     Args:
@@ -25,10 +47,11 @@ class SetToGameInline(admin.TabularInline):
     """
 
     model = SetToGame
+    related = ('set', 'game')
     extra = 1
 
 
-class GameGenreInline(admin.TabularInline):
+class GameGenreInline(RelatedInline):
     """Inline class for GameGenre.
 
     Args:
@@ -36,10 +59,11 @@ class GameGenreInline(admin.TabularInline):
     """
 
     model = GameGenre
+    related = ('game', 'genre')
     extra = 1
 
 
-class ClubAddressInline(admin.TabularInline):
+class ClubAddressInline(RelatedInline):
     """Inline class for ClubAddress.
 
     Args:
@@ -47,10 +71,11 @@ class ClubAddressInline(admin.TabularInline):
     """
 
     model = ClubAddress
+    related = ('club', 'address')
     extra = 1
 
 
-class ClubClientInline(admin.TabularInline):
+class ClubClientInline(RelatedInline):
     """Inline class for ClubClient.
 
     Args:
@@ -58,11 +83,23 @@ class ClubClientInline(admin.TabularInline):
     """
 
     model = ClubClient
+    related = ('club', 'client__user')
     extra = 1
 
 
+class PagedAdmin(admin.ModelAdmin):
+    """Admin class paging changelists without the unfiltered count.
+
+    Args:
+        admin: django admin
+    """
+
+    list_per_page = 50
+    show_full_result_count = False
+
+
 @admin.register(Client)
-class ClientAdmin(admin.ModelAdmin):
+class ClientAdmin(PagedAdmin):
     """Admin class for Client.
 
     Args:
@@ -70,11 +107,12 @@ class ClientAdmin(admin.ModelAdmin):
     """
 
     model = Client
+    list_select_related = ('user',)
     inlines = (ClubClientInline,)
 
 
 @admin.register(BoardGame)
-class BoardGameAdmin(admin.ModelAdmin):
+class BoardGameAdmin(PagedAdmin):
     """Admin class for BoardGame.
 
     Args:
@@ -82,12 +120,12 @@ class BoardGameAdmin(admin.ModelAdmin):
     """
 
     model = BoardGame
-    search_fields = ['name', 'genre', 'level']
+    search_fields = ['^name']
     inlines = (ClubToGameInline, SetToGameInline, GameGenreInline)
 
 
 @admin.register(GameSet)
-class GameSetAdmin(admin.ModelAdmin):
+class GameSetAdmin(PagedAdmin):
     """Admin class for GameSet.
 
     Args:
@@ -95,12 +133,12 @@ class GameSetAdmin(admin.ModelAdmin):
     """
 
     model = GameSet
-    search_fields = ['name']
+    search_fields = ['^name']
     inlines = (SetToGameInline,)
 
 
 @admin.register(Club)
-class ClubAdmin(admin.ModelAdmin):
+class ClubAdmin(PagedAdmin):
     """Admin class for Club.
 
     Args:
@@ -108,12 +146,12 @@ class ClubAdmin(admin.ModelAdmin):
     """
 
     model = Club
-    search_fields = ['name', 'address', 'phone_number']
+    search_fields = ['^name', 'phone_number__startswith']
     inlines = (ClubToGameInline, ClubAddressInline)
 
 
 @admin.register(Address)
-class AddressAdmin(admin.ModelAdmin):
+class AddressAdmin(PagedAdmin):
     """Admin class for Address.
 
     Args:
@@ -125,7 +163,7 @@ class AddressAdmin(admin.ModelAdmin):
 
 
 @admin.register(Genre)
-class GenreAdmin(admin.ModelAdmin):
+class GenreAdmin(PagedAdmin):
     """Admin class for Genre.
 
     Args:
@@ -7,3 +7,7 @@ class MainGameConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_game'
+
+    def ready(self) -> None:
+        """Connect signal handlers."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,37 @@
+"""Authentication file."""
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_TIMEOUT = 60
+
+
+def token_key(key: str) -> str:
+    """Return the cache key of the credentials of an API token.
+
+    Args:
+        key (str): The API token.
+
+    Returns:
+        str: cache key
+    """
+    return f'token:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication caching the user of a token for a short time."""
+
+    def authenticate_credentials(self, key):
+        """Return the user and token for a token key, using the cache first.
+
+        Args:
+            key (str): The API token.
+
+        Returns:
+            tuple: user and token
+        """
+        cache_key = token_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, TOKEN_TIMEOUT)
+        return credentials
@@ -0,0 +1,78 @@
+"""Counts file."""
+from django.core.cache import cache
+from django.db import connection
+
+COUNT_TIMEOUT = 60
+
+
+def count_key(model_class) -> str:
+    """Return the cache key of the row count of a model.
+
+    Args:
+        model_class (class): The Django model class.
+
+    Returns:
+        str: cache key
+    """
+    return f'count:{model_class.__module__}.{model_class.__name__}'
+
+
+def table_name(model_class) -> str:
+    """Return the quoted table name of a model.
+
+    Args:
+        model_class (class): The Django model class.
+
+    Returns:
+        str: quoted table name
+    """
+    return connection.ops.quote_name(model_class._meta.db_table)  # noqa: WPS437
+
+
+def fetch_counts(model_classes) -> tuple[int, ...]:
+    """Count the rows of several models in a single query.
+
+    Args:
+        model_classes (tuple): The Django model classes.
+
+    Returns:
+        tuple[int, ...]: number of rows of each model
+    """
+    subqueries = ', '.join(f'(SELECT COUNT(*) FROM {table_name(model_class)})' for model_class in model_classes)  # noqa: S608
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT {subqueries}')
+        return cursor.fetchone()
+
+
+def get_counts(*model_classes) -> dict:
+    """Return the row counts of models, cached for a short time.
+
+    Counts missing from the cache are fetched together in one query.
+
+    Args:
+        model_classes (class): The Django model classes.
+
+    Returns:
+        dict: number of rows by model class
+    """
+    keys = {model_class: count_key(model_class) for model_class in model_classes}
+    cached = cache.get_many(keys.values())
+    counts = {model_class: cached.get(key) for model_class, key in keys.items()}
+    missing = [model_class for model_class, count in counts.items() if count is None]
+    if missing:
+        fetched = dict(zip(missing, fetch_counts(missing)))
+        cache.set_many({keys[model_class]: count for model_class, count in fetched.items()}, COUNT_TIMEOUT)
+        counts.update(fetched)
+    return counts
+
+
+def get_count(model_class) -> int:
+    """Return the row count of a model, cached for a short time.
+
+    Args:
+        model_class (class): The Django model class.
+
+    Returns:
+        int: number of rows
+    """
+    return get_counts(model_class)[model_class]
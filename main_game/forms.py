@@ -1,9 +1,13 @@
 """Forms file."""
 from django.contrib.auth import forms, models
+from django.core.cache import cache
 from django.forms import Form, ModelChoiceField
 
 from .models import Club
 
+CLUB_CHOICES_KEY = 'join_club_choices'
+CLUB_CHOICES_TIMEOUT = 60
+
 
 class Registration(forms.UserCreationForm):
     """Form class for registration."""
@@ -25,4 +29,19 @@ class Registration(forms.UserCreationForm):
 class Join(Form):
     """Form class for join club."""
 
-    club = ModelChoiceField(queryset=Club.objects.all(), label='Выберите клуб')
+    club = ModelChoiceField(queryset=Club.objects.only('id', 'name'), label='Выберите клуб')
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Fill the club choices from the cache.
+
+        Args:
+            args (any): arguments
+            kwargs (any): kwargs
+        """
+        super().__init__(*args, **kwargs)
+        field = self.fields['club']
+        choices = cache.get(CLUB_CHOICES_KEY)
+        if choices is None:
+            choices = [(str(pk), name) for pk, name in field.queryset.values_list('pk', 'name')]
+            cache.set(CLUB_CHOICES_KEY, choices, CLUB_CHOICES_TIMEOUT)
+        field.choices = [('', field.empty_label), *choices]
@@ -0,0 +1,46 @@
+"""Middleware file."""
+from functools import partial
+
+from django.utils.functional import SimpleLazyObject
+
+from .models import Client
+
+
+def get_client(user):
+    """Return the client of a user together with the user data.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        Client: client of the user
+    """
+    return Client.objects.select_related('user').get(user=user)
+
+
+class ClientMiddleware:
+    """Middleware attaching the client of the user to the request.
+
+    The client is loaded on first access, so requests that do not use it
+    do not query it.
+    """
+
+    def __init__(self, get_response):
+        """Initialize the middleware.
+
+        Args:
+            get_response (callable): The next handler in the chain.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Attach a lazily loaded client to the request.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: response of the next handler
+        """
+        request.client = SimpleLazyObject(partial(get_client, request.user))
+        return self.get_response(request)
@@ -0,0 +1,118 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 10:00
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+
+def index_field(index, alter_field):
+    """Alter a field to add db_index, dropping the index by name when unapplied.
+
+    The schema qualified db_table hides the index from introspection,
+    so AlterField cannot find it on its own.
+
+    Args:
+        index (str): name of the index in the game_site schema
+        alter_field (AlterField): operation adding db_index to the field
+
+    Returns:
+        Operation: migration operation
+    """
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[
+            alter_field,
+            migrations.RunSQL(migrations.RunSQL.noop, f'DROP INDEX IF EXISTS game_site.{index};'),
+        ],
+        state_operations=[alter_field],
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        index_field(
+            'addresses_city_348c6bd6',
+            migrations.AlterField(
+                model_name='address',
+                name='city',
+                field=models.CharField(blank=True, db_index=True, default='Sirius', max_length=100, verbose_name='city'),
+            ),
+        ),
+        migrations.AlterField(
+            model_name='address',
+            name='region',
+            field=models.CharField(max_length=100, verbose_name='region'),
+        ),
+        index_field(
+            'boardgames_level_75ad2c8f',
+            migrations.AlterField(
+                model_name='boardgame',
+                name='level',
+                field=models.PositiveIntegerField(db_index=True, verbose_name='level'),
+            ),
+        ),
+        index_field(
+            'boardgames_name_5a63b824',
+            migrations.AlterField(
+                model_name='boardgame',
+                name='name',
+                field=models.CharField(db_index=True, max_length=100, verbose_name='name'),
+            ),
+        ),
+        index_field(
+            'clubs_name_caf1e1e2',
+            migrations.AlterField(
+                model_name='club',
+                name='name',
+                field=models.CharField(db_index=True, max_length=100, verbose_name='name'),
+            ),
+        ),
+        index_field(
+            'game_sets_name_775f48a6',
+            migrations.AlterField(
+                model_name='gameset',
+                name='name',
+                field=models.CharField(db_index=True, max_length=100, verbose_name='name'),
+            ),
+        ),
+        index_field(
+            'genres_name_35c54bf5',
+            migrations.AlterField(
+                model_name='genre',
+                name='name',
+                field=models.CharField(db_index=True, default='no genre', max_length=100, verbose_name='name'),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='address',
+            index=models.Index(fields=['region', 'city', 'street'], name='address_ordering_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardgame',
+            index=GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='boardgame_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='club_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='gameset',
+            index=GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='gameset_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='genre',
+            index=GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='genre_name_trgm'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 10:30
+
+from django.db import migrations, models
+
+import main_game.models
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='boardgame',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubaddress',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubclient',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubtogame',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='gamegenre',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='gameset',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='settogame',
+            name='id',
+            field=models.UUIDField(default=main_game.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
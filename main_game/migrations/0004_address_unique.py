@@ -0,0 +1,33 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0003_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='home',
+            field=models.CharField(blank=True, max_length=100, null=True, verbose_name='home'),
+        ),
+        migrations.AlterField(
+            model_name='address',
+            name='street',
+            field=models.CharField(blank=True, max_length=100, null=True, verbose_name='street'),
+        ),
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.UniqueConstraint(fields=('region', 'city', 'street', 'home'), name='uniq_address', nulls_distinct=False),
+        ),
+    ]
@@ -0,0 +1,25 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 11:30
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0004_address_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='boardgame',
+            name='level',
+            field=models.PositiveSmallIntegerField(db_index=True, validators=[django.core.validators.MaxValueValidator(100)], verbose_name='level'),
+        ),
+    ]
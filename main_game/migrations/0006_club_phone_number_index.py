@@ -0,0 +1,36 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+import main_game.models
+
+# The schema qualified db_table hides the index from introspection,
+# so it is dropped by name when the migration is unapplied.
+alter_phone_number = migrations.AlterField(
+    model_name='club',
+    name='phone_number',
+    field=models.CharField(db_index=True, max_length=main_game.models.PHONE_MAX_LEN, validators=[main_game.models.phone_number_validator], verbose_name='phone_number'),
+)
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0005_boardgame_level_range'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                alter_phone_number,
+                migrations.RunSQL(migrations.RunSQL.noop, 'DROP INDEX IF EXISTS game_site.clubs_phone_number_88c812fd;'),
+            ],
+            state_operations=[alter_phone_number],
+        ),
+    ]
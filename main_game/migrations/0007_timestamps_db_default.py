@@ -0,0 +1,274 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 12:30
+
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+import main_game.models
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0006_club_phone_number_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='address',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='boardgame',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='boardgame',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='clubaddress',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='clubaddress',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='clubclient',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='clubtogame',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='clubtogame',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='gamegenre',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='gamegenre',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='gameset',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='gameset',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='settogame',
+            name='created',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='created',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='settogame',
+            name='modified',
+            field=models.DateTimeField(
+                blank=True,
+                db_default=Now(),
+                editable=False,
+                null=True,
+                validators=[main_game.models.check_not_future],
+                verbose_name='modified',
+            ),
+        ),
+    ]
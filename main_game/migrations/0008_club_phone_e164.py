@@ -0,0 +1,38 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 13:00
+
+from django.db import migrations, models
+
+ADD_PHONE_E164 = [
+    r"DO $$ BEGIN ALTER TABLE game_site.clubs ADD CONSTRAINT club_phone_e164 CHECK (phone_number ~ '^\+7[0-9]{10}$') NOT VALID; EXCEPTION WHEN duplicate_object THEN NULL; END $$;",
+    'ALTER TABLE game_site.clubs VALIDATE CONSTRAINT club_phone_e164;',
+]
+DROP_PHONE_E164 = 'ALTER TABLE game_site.clubs DROP CONSTRAINT IF EXISTS club_phone_e164;'
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('main_game', '0007_timestamps_db_default'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(ADD_PHONE_E164, DROP_PHONE_E164),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='club',
+                    constraint=models.CheckConstraint(check=models.Q(('phone_number__regex', r'^\+7[0-9]{10}$')), name='club_phone_e164'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,67 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 13:30
+
+from django.db import migrations, models
+
+
+def drop_unique_together(model_name, table, constraint, columns):
+    """Drop a unique_together constraint by its generated name.
+
+    The schema qualified db_table hides the constraint from introspection,
+    so AlterUniqueTogether cannot find it on its own.
+
+    Args:
+        model_name (str): name of the model in the migration state
+        table (str): table name in the game_site schema
+        constraint (str): name of the unique constraint
+        columns (str): constrained columns
+
+    Returns:
+        Operation: migration operation
+    """
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[
+            migrations.RunSQL(
+                f'ALTER TABLE game_site.{table} DROP CONSTRAINT IF EXISTS {constraint};',
+                f'ALTER TABLE game_site.{table} ADD CONSTRAINT {constraint} UNIQUE ({columns});',
+            ),
+        ],
+        state_operations=[
+            migrations.AlterUniqueTogether(name=model_name, unique_together=set()),
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0008_club_phone_e164'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='clubtogame',
+            constraint=models.UniqueConstraint(fields=('club', 'game'), include=('id',), name='club_to_game_uniq'),
+        ),
+        drop_unique_together('clubtogame', 'club_to_game', 'club_to_game_club_id_game_id_226f8161_uniq', 'club_id, game_id'),
+        migrations.AddConstraint(
+            model_name='settogame',
+            constraint=models.UniqueConstraint(fields=('set', 'game'), include=('id',), name='set_to_game_uniq'),
+        ),
+        drop_unique_together('settogame', 'set_to_game', 'set_to_game_set_id_game_id_297c9695_uniq', 'set_id, game_id'),
+        migrations.AddConstraint(
+            model_name='gamegenre',
+            constraint=models.UniqueConstraint(fields=('game', 'genre'), include=('id',), name='game_genre_uniq'),
+        ),
+        drop_unique_together('gamegenre', 'game_genre', 'game_genre_game_id_genre_id_7313ccbe_uniq', 'game_id, genre_id'),
+        migrations.AddConstraint(
+            model_name='clubaddress',
+            constraint=models.UniqueConstraint(fields=('club', 'address'), include=('id',), name='club_address_uniq'),
+        ),
+        drop_unique_together('clubaddress', 'club_address', 'club_address_club_id_address_id_e95bc3fb_uniq', 'club_id, address_id'),
+    ]
@@ -0,0 +1,23 @@
+"""Migration file."""
+# Generated by Django 5.0.6 on 2026-10-15 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    dependencies = [
+        ('main_game', '0009_through_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='clubclient',
+            constraint=models.UniqueConstraint(fields=('club', 'client'), include=('id',), name='club_client_uniq'),
+        ),
+    ]
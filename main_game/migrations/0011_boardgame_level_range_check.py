@@ -0,0 +1,38 @@
+"""Migration file."""
+# Generated by Django 5.0.14 on 2026-10-15 22:45
+
+from django.db import migrations, models
+
+ADD_LEVEL_RANGE = [
+    'DO $$ BEGIN ALTER TABLE game_site.boardgames ADD CONSTRAINT boardgame_level_range CHECK (level <= 100) NOT VALID; EXCEPTION WHEN duplicate_object THEN NULL; END $$;',
+    'ALTER TABLE game_site.boardgames VALIDATE CONSTRAINT boardgame_level_range;',
+]
+DROP_LEVEL_RANGE = 'ALTER TABLE game_site.boardgames DROP CONSTRAINT IF EXISTS boardgame_level_range;'
+
+
+class Migration(migrations.Migration):
+    """Migration class.
+
+    Args:
+        migrations (class): django migration
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('main_game', '0010_clubclient_unique'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(ADD_LEVEL_RANGE, DROP_LEVEL_RANGE),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='boardgame',
+                    constraint=models.CheckConstraint(check=models.Q(level__lte=100), name='boardgame_level_range'),
+                ),
+            ],
+        ),
+    ]
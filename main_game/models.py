@@ -1,23 +1,59 @@
 """Models file."""
-import re
+import os
+import time
 from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID
 
 from django.conf.global_settings import AUTH_USER_MODEL
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator
 from django.db import models
+from django.db.models.expressions import DatabaseDefault
+from django.db.models.functions import Now, Upper
 from django.utils.translation import gettext_lazy as _
 
 NAME_MAX_LEN = 100
 ADDRESS_MAX_LEN = 100
 PHONE_MAX_LEN = 12
 DESCRIPTION_MAX_LEN = 1000
+LEVEL_MAX = 100
+
+_NS_PER_MS = 1000000
+_RANDOM_BYTES = 10
+_TIME_SHIFT = 80
+_VERSION_SHIFT = 76
+_VERSION_BITS = 0xF
+_VERSION_NUMBER = 7
+_VARIANT_SHIFT = 62
+_VARIANT_BITS = 0b11
+_VARIANT_NUMBER = 0b10
+_VERSION_MASK = ~(_VERSION_BITS << _VERSION_SHIFT)
+_VERSION = _VERSION_NUMBER << _VERSION_SHIFT
+_VARIANT_MASK = ~(_VARIANT_BITS << _VARIANT_SHIFT)
+_VARIANT = _VARIANT_NUMBER << _VARIANT_SHIFT
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (version 7).
+
+    The leading 48 bits hold the unix time in milliseconds, so new keys
+    are appended to the right edge of the primary key index.
+
+    Returns:
+        UUID: generated identifier
+    """
+    unix_ms = time.time_ns() // _NS_PER_MS
+    value = (unix_ms << _TIME_SHIFT) | int.from_bytes(os.urandom(_RANDOM_BYTES), 'big')
+    value = (value & _VERSION_MASK) | _VERSION
+    value = (value & _VARIANT_MASK) | _VARIANT
+    return UUID(int=value)
 
 
 class UUIDMixin(models.Model):
     """Mixin class providing UUID primary key field."""
 
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     class Meta:
         """Meta class."""
@@ -34,24 +70,24 @@ def get_datetime():
     return datetime.now(timezone.utc)
 
 
-def check_created(dt: datetime):
-    """Validate created datetime.
+def related_label(instance: models.Model, field_name: str) -> str:
+    """Represent a foreign key without querying the related object.
 
     Args:
-        dt (datetime): The datetime to validate.
+        instance (Model): The model instance holding the foreign key.
+        field_name (str): The name of the foreign key field.
 
-    Raises:
-        ValidationError: If the datetime is in the future.
+    Returns:
+        str: related object if it is already loaded, its primary key otherwise
     """
-    if dt > get_datetime():
-        raise ValidationError(
-            _('Date and time cannot be in the future.'),
-            params={'created': dt},
-        )
+    descriptor = getattr(type(instance), field_name)
+    if descriptor.is_cached(instance):
+        return str(getattr(instance, field_name))
+    return str(getattr(instance, descriptor.field.attname))
 
 
-def check_modified(dt: datetime):
-    """Validate modified datetime.
+def check_not_future(dt: datetime):
+    """Validate created or modified datetime.
 
     Args:
         dt (datetime): The datetime to validate.
@@ -60,14 +96,16 @@ def check_modified(dt: datetime):
         ValidationError: If the datetime is in the future.
     """
     if dt > get_datetime():
-        raise ValidationError(
-            _('Date and time cannot be in the future.'),
-            params={'modified': dt},
-        )
+        raise ValidationError(_('Date and time cannot be in the future.'))
+
+
+# Validators referenced by migration 0001.
+check_created = check_not_future
+check_modified = check_not_future
 
 
 def check_level(number) -> None:
-    """Validate game level.
+    """Validate game level, kept for migration 0001.
 
     Args:
         number (int): The level of the game.
@@ -75,10 +113,23 @@ def check_level(number) -> None:
     Raises:
         ValidationError: If the level is not within the valid range (0-100).
     """
-    if number < 0 or number > 100:
+    if number < 0 or number > LEVEL_MAX:
         raise ValidationError('Value should be between zero and one hundred.')
 
 
+def is_phone_number(number: str) -> bool:
+    """Check the number is +7 followed by ten ASCII digits.
+
+    Args:
+        number (str): The phone number to check.
+
+    Returns:
+        bool: True if the number is in the format +79999999999
+    """
+    digits = number[2:]
+    return len(number) == PHONE_MAX_LEN and number.startswith('+7') and digits.isascii() and digits.isdigit()
+
+
 def phone_number_validator(number: str) -> None:
     """Validate phone number format.
 
@@ -88,8 +139,7 @@ def phone_number_validator(number: str) -> None:
     Raises:
         ValidationError: If the phone number format is invalid.
     """
-    rule = re.compile(r'^\+7[0-9]{3}[0-9]{7}$')
-    if not rule.search(number):
+    if not is_phone_number(number):
         raise ValidationError(
             _('Phone number must be in the format +79999999999.'),
             params={'phone_number': number},
@@ -101,9 +151,9 @@ class CreatedMixin(models.Model):
 
     created = models.DateTimeField(
         _('created'),
-        null=True, blank=True,
-        default=get_datetime,
-        validators=[check_created],
+        null=True, blank=True, editable=False,
+        db_default=Now(),
+        validators=[check_not_future],
     )
 
     class Meta:
@@ -117,9 +167,9 @@ class ModifiedMixin(models.Model):
 
     modified = models.DateTimeField(
         _('modified'),
-        null=True, blank=True,
-        default=get_datetime,
-        validators=[check_modified],
+        null=True, blank=True, editable=False,
+        db_default=Now(),
+        validators=[check_not_future],
     )
 
     class Meta:
@@ -140,8 +190,10 @@ class Club(UUIDMixin, CreatedMixin, ModifiedMixin):
         str: String representation of the club.
     """
 
-    name = models.TextField(_('name'), null=False, blank=False, max_length=ADDRESS_MAX_LEN)
-    phone_number = models.TextField(_('phone_number'), null=False, blank=False, validators=[phone_number_validator])
+    name = models.CharField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN, db_index=True)
+    phone_number = models.CharField(
+        _('phone_number'), null=False, blank=False, max_length=PHONE_MAX_LEN, db_index=True, validators=[phone_number_validator],
+    )
 
     games = models.ManyToManyField('BoardGame', through='ClubToGame')
     addresses = models.ManyToManyField('Address', through='ClubAddress')
@@ -159,6 +211,12 @@ class Club(UUIDMixin, CreatedMixin, ModifiedMixin):
 
         db_table = '"game_site"."clubs"'
         ordering = ['name']
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='club_name_trgm'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(phone_number__regex=r'^\+7[0-9]{10}$'), name='club_phone_e164'),
+        ]
         verbose_name = _('club')
 
 
@@ -174,8 +232,10 @@ class BoardGame(UUIDMixin, CreatedMixin, ModifiedMixin):
         str: String representation of the board game.
     """
 
-    name = models.TextField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN)
-    level = models.PositiveIntegerField(_('level'), null=False, blank=False, validators=[check_level])
+    name = models.CharField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN, db_index=True)
+    level = models.PositiveSmallIntegerField(
+        _('level'), null=False, blank=False, db_index=True, validators=[MaxValueValidator(LEVEL_MAX)],
+    )
 
     genres = models.ManyToManyField('Genre', through='GameGenre')
     clubs = models.ManyToManyField('Club', through='ClubToGame')
@@ -194,6 +254,12 @@ class BoardGame(UUIDMixin, CreatedMixin, ModifiedMixin):
 
         db_table = '"game_site"."boardgames"'
         ordering = ['name']
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='boardgame_name_trgm'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(level__lte=LEVEL_MAX), name='boardgame_level_range'),
+        ]
         verbose_name = _('boardgame')
 
 
@@ -209,7 +275,7 @@ class Genre(UUIDMixin, CreatedMixin, ModifiedMixin):
         str: String representation of the genre.
     """
 
-    name = models.TextField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN, default='no genre')
+    name = models.CharField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN, db_index=True, default='no genre')
     description = models.TextField(_('description'), null=True, blank=True, max_length=DESCRIPTION_MAX_LEN)
 
     games = models.ManyToManyField('BoardGame', through='GameGenre')
@@ -227,6 +293,9 @@ class Genre(UUIDMixin, CreatedMixin, ModifiedMixin):
 
         db_table = '"game_site"."genres"'
         ordering = ['name']
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='genre_name_trgm'),
+        ]
         verbose_name = _('genre')
 
 
@@ -242,10 +311,10 @@ class Address(UUIDMixin, CreatedMixin, ModifiedMixin):
         str: String representation of the address.
     """
 
-    region = models.TextField(_('region'), null=False, blank=False, max_length=NAME_MAX_LEN)
-    city = models.TextField(_('city'), null=False, blank=True, default='Sirius', max_length=NAME_MAX_LEN)
-    street = models.TextField(_('street'), null=True, blank=True, max_length=NAME_MAX_LEN)
-    home = models.TextField(_('home'), null=True, blank=True, max_length=NAME_MAX_LEN)
+    region = models.CharField(_('region'), null=False, blank=False, max_length=NAME_MAX_LEN)
+    city = models.CharField(_('city'), null=False, blank=True, default='Sirius', max_length=NAME_MAX_LEN, db_index=True)
+    street = models.CharField(_('street'), null=True, blank=True, max_length=NAME_MAX_LEN)
+    home = models.CharField(_('home'), null=True, blank=True, max_length=NAME_MAX_LEN)
 
     clubs = models.ManyToManyField('Club', through='ClubAddress')
 
@@ -262,6 +331,12 @@ class Address(UUIDMixin, CreatedMixin, ModifiedMixin):
 
         db_table = '"game_site"."addresses"'
         ordering = ['region', 'city', 'street']
+        indexes = [
+            models.Index(fields=['region', 'city', 'street'], name='address_ordering_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['region', 'city', 'street', 'home'], name='uniq_address', nulls_distinct=False),
+        ]
         verbose_name = _('address')
         verbose_name_plural = _('addresses')
 
@@ -278,7 +353,7 @@ class GameSet(UUIDMixin, CreatedMixin, ModifiedMixin):
         str: String representation of the game set.
     """
 
-    name = models.TextField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN)
+    name = models.CharField(_('name'), null=False, blank=False, max_length=NAME_MAX_LEN, db_index=True)
     description = models.TextField(_('description'), null=False, blank=True, default='', max_length=DESCRIPTION_MAX_LEN)
 
     games = models.ManyToManyField('BoardGame', through='SetToGame')
@@ -296,6 +371,9 @@ class GameSet(UUIDMixin, CreatedMixin, ModifiedMixin):
 
         db_table = '"game_site"."game_sets"'
         ordering = ['name']
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='gameset_name_trgm'),
+        ]
         verbose_name = _('game_set')
 
 
@@ -319,15 +397,16 @@ class ClubToGame(UUIDMixin, CreatedMixin, ModifiedMixin):
         Returns:
             str: club and game
         """
-        return f'club {self.club} - game {self.game}'
+        club, game = related_label(self, 'club'), related_label(self, 'game')
+        return f'club {club} - game {game}'
 
     class Meta:
         """Meta class."""
 
         db_table = '"game_site"."club_to_game"'
-        unique_together = (
-            ('club', 'game'),
-        )
+        constraints = [
+            models.UniqueConstraint(fields=['club', 'game'], include=['id'], name='club_to_game_uniq'),
+        ]
         verbose_name = _('Relationship club game')
 
 
@@ -351,15 +430,16 @@ class SetToGame(UUIDMixin, CreatedMixin, ModifiedMixin):
         Returns:
             str: set and game
         """
-        return f'set {self.set} - game {self.game}'
+        game_set, game = related_label(self, 'set'), related_label(self, 'game')
+        return f'set {game_set} - game {game}'
 
     class Meta:
         """Meta class."""
 
         db_table = '"game_site"."set_to_game"'
-        unique_together = (
-            ('set', 'game'),
-        )
+        constraints = [
+            models.UniqueConstraint(fields=['set', 'game'], include=['id'], name='set_to_game_uniq'),
+        ]
         verbose_name = _('Relationship set game')
 
 
@@ -383,15 +463,16 @@ class GameGenre(UUIDMixin, CreatedMixin, ModifiedMixin):
         Returns:
             str: game and genre
         """
-        return f'game {self.game} - genre {self.genre}'
+        game, genre = related_label(self, 'game'), related_label(self, 'genre')
+        return f'game {game} - genre {genre}'
 
     class Meta:
         """Meta class."""
 
         db_table = '"game_site"."game_genre"'
-        unique_together = (
-            ('game', 'genre'),
-        )
+        constraints = [
+            models.UniqueConstraint(fields=['game', 'genre'], include=['id'], name='game_genre_uniq'),
+        ]
         verbose_name = _('Relationship game genre')
 
 
@@ -415,95 +496,25 @@ class ClubAddress(UUIDMixin, CreatedMixin, ModifiedMixin):
         Returns:
             str: club and address
         """
-        return f'club {self.club} - address {self.address}'
+        club, address = related_label(self, 'club'), related_label(self, 'address')
+        return f'club {club} - address {address}'
 
     class Meta:
         """Meta class."""
 
         db_table = '"game_site"."club_address"'
-        unique_together = (
-            ('club', 'address'),
-        )
+        constraints = [
+            models.UniqueConstraint(fields=['club', 'address'], include=['id'], name='club_address_uniq'),
+        ]
         verbose_name = _('Relationship club address')
 
 
-def create_manager(validators: tuple[tuple[str, callable]]):
-    """Create a custom manager for models.
-
-    Args:
-        validators (tuple[tuple[str, callable]]): Tuple of attribute names and corresponding validators
-
-    Returns:
-        Manager: Custom manager class
-    """
-
-    class Manager(models.Manager):
-        """Custom manager class."""
-
-        @staticmethod
-        def check_and_validate(kwargs, value, validator):
-            """Check and validate attributes.
-
-            Args:
-                kwargs (any): kwargs
-                value (any): value
-                validator (any): validator
-            """
-            if value in kwargs.keys():
-                validator(kwargs.get(value))
-
-        def create(self, **kwargs):
-            """Override create method to include validation.
-
-            Args:
-                kwargs (any): kwargs
-
-            Returns:
-                function: create function
-            """
-            for value, validator in validators:
-                self.check_and_validate(kwargs, value, validator)
-            return super().create(**kwargs)
-
-    return Manager
-
-
-def create_save(validators: tuple[tuple[str, callable]]):
-    """Create a custom save method for models.
-
-    Args:
-        validators (tuple[tuple[str, callable]]): Tuple of attribute names and corresponding validators
-
-    Returns:
-        function: Custom save method
-    """
-
-    def save(self, *args, **kwargs) -> None:
-        """Override save method to include validation.
-
-        Args:
-            kwargs (any): kwargs
-            args (any): arguments
-            self (any): class self
-
-        Returns:
-            function: save function
-        """
-        for value, validator in validators:
-            validator(getattr(self, value))
-        return super(self.__class__, self).save(*args, **kwargs)
-
-    return save
-
-
 class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
     """Model class representing a client/user in the system.
 
     Args:
         user (User): User associated with the client
         clubs (ManyToManyField): Clubs associated with the client
-        objects (Manager): Custom manager with validation methods
-        save (function): Custom save method with validation
 
     Returns:
         str: String representation of the client
@@ -511,8 +522,6 @@ class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
 
     user = models.OneToOneField(AUTH_USER_MODEL, unique=True, verbose_name=_('user'), on_delete=models.CASCADE)
     clubs = models.ManyToManyField(Club, through='ClubClient', verbose_name=_('clubs'))
-    objects = create_manager((('created', check_created), ('modified', check_modified)))
-    save = create_save((('created', check_created), ('modified', check_modified)))
 
     class Meta:
         """Meta class."""
@@ -521,6 +530,17 @@ class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
         verbose_name = _('client')
         verbose_name_plural = _('clients')
 
+    def save(self, *args, **kwargs) -> None:
+        """Validate the client fields before saving.
+
+        Args:
+            args (any): arguments
+            kwargs (any): kwargs
+        """
+        db_defaults = [name for name in ('created', 'modified') if isinstance(getattr(self, name), DatabaseDefault)]
+        self.full_clean(exclude=['user', 'clubs', *db_defaults], validate_unique=False)
+        super().save(*args, **kwargs)
+
     @property
     def username(self) -> str:
         """Property to get the username of the associated user.
@@ -575,5 +595,8 @@ class ClubClient(UUIDMixin, CreatedMixin):
         """Meta class."""
 
         db_table = '"game_site"."club_client"'
+        constraints = [
+            models.UniqueConstraint(fields=['club', 'client'], include=['id'], name='club_client_uniq'),
+        ]
         verbose_name = _('relationship club client')
         verbose_name_plural = _('relationships club client')
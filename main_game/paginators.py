@@ -0,0 +1,42 @@
+"""Paginators file."""
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from .counts import get_count
+
+
+class PkSlicePaginator(Paginator):
+    """Paginator slicing primary keys before fetching the rows of a page."""
+
+    def page(self, number):
+        """Return a page whose rows are fetched by primary key.
+
+        Only the primary keys are read while skipping the previous pages,
+        so deep pages do not materialize full rows of the offset.
+
+        Args:
+            number (int): The page number.
+
+        Returns:
+            Page: requested page
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        return self._get_page(self.object_list.filter(pk__in=pks), number, self)
+
+
+class CachedCountPaginator(PkSlicePaginator):
+    """Paginator over a whole table reusing its cached row count."""
+
+    @cached_property
+    def count(self) -> int:
+        """Return the cached number of rows of the paginated model.
+
+        Returns:
+            int: number of rows
+        """
+        return get_count(self.object_list.model)
@@ -1,12 +1,51 @@
 """Serializers file."""
-from rest_framework.serializers import HyperlinkedModelSerializer
+from rest_framework.serializers import (HyperlinkedModelSerializer,
+                                        PrimaryKeyRelatedField,
+                                        ValidationError)
 
 from .models import Address, BoardGame, Club, GameSet, Genre
 
 
+class NullsEqualUniqueValidator:
+    """Validator for a unique constraint whose NULL values compare equal."""
+
+    requires_context = True
+    message = 'The fields {0} must make a unique set.'
+
+    def __init__(self, queryset, fields):
+        """Set up the validator.
+
+        Args:
+            queryset (QuerySet): The rows the values must be unique among.
+            fields (tuple): The fields of the constraint.
+        """
+        self.queryset = queryset
+        self.fields = fields
+
+    def __call__(self, attrs, serializer):
+        """Reject values already stored in another row, missing values included.
+
+        Args:
+            attrs (dict): The validated values.
+            serializer (Serializer): The validated serializer.
+
+        Raises:
+            ValidationError: If another row has the same values.
+        """
+        row = serializer.instance or self.queryset.model(**attrs)
+        duplicates = self.queryset.filter(**{name: attrs.get(name, getattr(row, name)) for name in self.fields})
+        if serializer.instance is not None:
+            duplicates = duplicates.exclude(pk=serializer.instance.pk)
+        if duplicates.exists():
+            raise ValidationError(self.message.format(', '.join(self.fields)), code='unique')
+
+
 class ClubSerializer(HyperlinkedModelSerializer):
     """Serializer for Club."""
 
+    games = PrimaryKeyRelatedField(many=True, read_only=True)
+    addresses = PrimaryKeyRelatedField(many=True, read_only=True)
+
     class Meta:
         """Meta class for ClubSerializer."""
 
@@ -23,6 +62,9 @@ class ClubSerializer(HyperlinkedModelSerializer):
 class BoardGameSerializer(HyperlinkedModelSerializer):
     """Serializer for BoardGame."""
 
+    genres = PrimaryKeyRelatedField(many=True, read_only=True)
+    clubs = PrimaryKeyRelatedField(many=True, read_only=True)
+
     class Meta:
         """Meta class for BoardGameSerializer."""
 
@@ -39,6 +81,8 @@ class BoardGameSerializer(HyperlinkedModelSerializer):
 class GameSetSerializer(HyperlinkedModelSerializer):
     """Serializer for GameSet."""
 
+    games = PrimaryKeyRelatedField(many=True, read_only=True)
+
     class Meta:
         """Meta class for GameSetSerializer."""
 
@@ -54,6 +98,8 @@ class GameSetSerializer(HyperlinkedModelSerializer):
 class GenreSerializer(HyperlinkedModelSerializer):
     """Serializer for Genre."""
 
+    games = PrimaryKeyRelatedField(many=True, read_only=True)
+
     class Meta:
         """Meta class for GenreSerializer."""
 
@@ -64,8 +110,12 @@ class GenreSerializer(HyperlinkedModelSerializer):
 class AddressSerializer(HyperlinkedModelSerializer):
     """Serializer for Address."""
 
+    clubs = PrimaryKeyRelatedField(many=True, read_only=True)
+
     class Meta:
         """Meta class for AddressSerializer."""
 
         model = Address
         fields = '__all__'
+        extra_kwargs = {'street': {'required': False}, 'home': {'required': False}}
+        validators = [NullsEqualUniqueValidator(Address.objects.all(), ('region', 'city', 'street', 'home'))]
@@ -0,0 +1,69 @@
+"""Signals file."""
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_key
+from .counts import count_key
+from .forms import CLUB_CHOICES_KEY
+from .models import Address, BoardGame, Club, GameSet, Genre
+
+COUNTED_MODELS = (Club, BoardGame, Genre, GameSet, Address)
+
+
+@receiver((post_save, post_delete), sender=Club)
+def invalidate_club_choices(**kwargs) -> None:
+    """Drop the cached club choices of the join form once the club change is committed.
+
+    Args:
+        kwargs (any): signal arguments
+    """
+    transaction.on_commit(partial(cache.delete, CLUB_CHOICES_KEY))
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_token(instance, **kwargs) -> None:
+    """Drop the cached credentials of a deleted API token once the delete is committed.
+
+    Args:
+        instance (Token): The deleted token.
+        kwargs (any): signal arguments
+    """
+    transaction.on_commit(partial(cache.delete, token_key(instance.key)))
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(instance, update_fields=None, **kwargs) -> None:
+    """Drop the cached credentials of the API tokens of a changed user once the change is committed.
+
+    Args:
+        instance (User): The saved user.
+        update_fields (frozenset): The saved fields, none for a full save.
+        kwargs (any): signal arguments
+    """
+    if update_fields == {'last_login'}:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    transaction.on_commit(partial(cache.delete_many, [token_key(key) for key in keys]))
+
+
+def invalidate_count(sender, created=True, **kwargs) -> None:
+    """Drop the cached row count of a model once a row added or deleted is committed.
+
+    Args:
+        sender (class): The Django model class.
+        created (bool): Whether a row was added, always true for deletes.
+        kwargs (any): signal arguments
+    """
+    if created:
+        transaction.on_commit(partial(cache.delete, count_key(sender)))
+
+
+for model_class in COUNTED_MODELS:
+    post_save.connect(invalidate_count, sender=model_class)
+    post_delete.connect(invalidate_count, sender=model_class)
@@ -15,15 +15,15 @@ router.register(r'addresses', views.AddressViewSet)
 urlpatterns = [
     path('', views.home, name='homepage'),
     path('clubs/', views.СlubListView.as_view(), name='clubs'),
-    path('club/', views.сlub_view, name='club'),
+    path('club/', views.ClubDetailView.as_view(), name='club'),
     path('boardgames/', views.BoardGameListView.as_view(), name='boardgames'),
-    path('boardgame/', views.boardgame_view, name='boardgame'),
+    path('boardgame/', views.BoardGameDetailView.as_view(), name='boardgame'),
     path('genres/', views.GenreListView.as_view(), name='genres'),
-    path('genre/', views.genre_view, name='genre'),
+    path('genre/', views.GenreDetailView.as_view(), name='genre'),
     path('addresses/', views.AddressListView.as_view(), name='addresses'),
-    path('address/', views.address_view, name='address'),
+    path('address/', views.AddressDetailView.as_view(), name='address'),
     path('gamesets/', views.GameSetListView.as_view(), name='gamesets'),
-    path('gameset/', views.gameset_view, name='gameset'),
+    path('gameset/', views.GameSetDetailView.as_view(), name='gameset'),
     path('register/', views.register, name='register'),
     path('accounts/', include('django.contrib.auth.urls')),
     path('api/', include(router.urls), name='api'),
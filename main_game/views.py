@@ -4,12 +4,13 @@ from typing import Any
 from django.contrib import messages
 from django.contrib.auth import decorators, mixins
 from django.core import exceptions
-from django.core import paginator as pg
+from django.db import IntegrityError, models, transaction
+from django.http import Http404
 from django.shortcuts import redirect, render
-from django.views.generic import ListView
-from rest_framework import authentication, permissions, viewsets
+from django.views.generic import DetailView, ListView
+from rest_framework import permissions, viewsets
 
-from .forms import Join, Registration
+from . import authentication, counts, forms, paginators
 from .models import (Address, BoardGame, Client, Club, ClubClient, GameSet,
                      Genre)
 from .serializers import (AddressSerializer, BoardGameSerializer,
@@ -25,26 +26,29 @@ def home(request):
     Returns:
         HttpResponse: Rendered response of the homepage view.
     """
+    record_counts = counts.get_counts(Club, BoardGame, Genre, GameSet, Address)
     return render(
         request,
         'index.html',
         {
-            'clubs': Club.objects.count(),
-            'boardgames': BoardGame.objects.count(),
-            'genres': Genre.objects.count(),
-            'gamesets': GameSet.objects.count(),
-            'addresses': Address.objects.count(),
+            'clubs': record_counts[Club],
+            'boardgames': record_counts[BoardGame],
+            'genres': record_counts[Genre],
+            'gamesets': record_counts[GameSet],
+            'addresses': record_counts[Address],
         },
     )
 
 
-def create_list_view(model_class, plural_name, template):
+def create_list_view(model_class, plural_name, template, only, order_by):
     """Create a ListView class for a given model.
 
     Args:
         model_class (class): The Django model class to create ListView for.
         plural_name (str): The plural name of the model (context object name).
         template (str): The path to the template to render the ListView.
+        only (tuple): The fields rendered by the template.
+        order_by (tuple): The fields the list is sorted by, before the primary key.
 
     Returns:
         class: Custom ListView class for the given model.
@@ -56,10 +60,20 @@ def create_list_view(model_class, plural_name, template):
         model = model_class
         template_name = template
         paginate_by = 10
+        paginator_class = paginators.CachedCountPaginator
         context_object_name = plural_name
+        ordering = (*order_by, 'pk')
+
+        def get_queryset(self):
+            """Load only the fields rendered by the template.
+
+            Returns:
+                QuerySet: objects to list
+            """
+            return super().get_queryset().only(*only)
 
         def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-            """Override get_context_data to add pagination.
+            """Override get_context_data to expose the current page.
 
             Args:
                 kwargs (any): kwargs
@@ -68,57 +82,69 @@ def create_list_view(model_class, plural_name, template):
                 dict[str, Any]: context data
             """
             context = super().get_context_data(**kwargs)
-            clubs = model_class.objects.all()
-            paginator = pg.Paginator(clubs, 10)
-            page = self.request.GET.get('page')
-            page_obj = paginator.get_page(page)
-            context[f'{plural_name}_list'] = page_obj
+            context[f'{plural_name}_list'] = context['page_obj']
             return context
 
     return CustomListView
 
 
-СlubListView = create_list_view(Club, 'clubs', 'catalog/clubs.html')
-BoardGameListView = create_list_view(BoardGame, 'boardgames', 'catalog/boardgames.html')
-GameSetListView = create_list_view(GameSet, 'gamesets', 'catalog/gamesets.html')
-AddressListView = create_list_view(Address, 'addresses', 'catalog/addresses.html')
-GenreListView = create_list_view(Genre, 'genres', 'catalog/genres.html')
+СlubListView = create_list_view(Club, 'clubs', 'catalog/clubs.html', only=('id', 'name'), order_by=('name',))
+BoardGameListView = create_list_view(BoardGame, 'boardgames', 'catalog/boardgames.html', only=('id', 'name'), order_by=('name',))
+GameSetListView = create_list_view(GameSet, 'gamesets', 'catalog/gamesets.html', only=('id', 'name'), order_by=('name',))
+AddressListView = create_list_view(Address, 'addresses', 'catalog/addresses.html', only=('id', 'region'), order_by=('region', 'city', 'street'))
+GenreListView = create_list_view(Genre, 'genres', 'catalog/genres.html', only=('id', 'name'), order_by=('name',))
 
 
-def create_view(model_class, context_name, template):
-    """Create a view function for rendering a single instance of a model.
+def create_detail_view(model_class, context_name, template, only):
+    """Create a DetailView class for a given model.
 
     Args:
-        model_class (class): The Django model class to create the view for.
+        model_class (class): The Django model class to create DetailView for.
         context_name (str): The context name for the model instance.
         template (str): The path to the template to render the model instance.
+        only (tuple): The fields rendered by the template.
 
     Returns:
-        function: View function for rendering a single model instance.
+        class: Custom DetailView class for the given model.
     """
 
-    @decorators.login_required
-    def view(request):
-        """View function to render a single instance of a model.
+    class CustomDetailView(mixins.LoginRequiredMixin, DetailView):
+        """Custom DetailView class."""
 
-        Args:
-            request (any): request
+        queryset = model_class.objects.only(*only)
+        template_name = template
+        context_object_name = context_name
 
-        Returns:
-            HttpResponse: Rendered response of the homepage view.
-        """
-        id_ = request.GET.get('id', None)
-        target = model_class.objects.get(id=id_) if id_ else None
-        return render(request, template, {context_name: target})
+        def get_object(self, queryset=None):
+            """Return the object with the id passed in the query string.
 
-    return view
+            Args:
+                queryset (QuerySet): The queryset to look the object up in.
+
+            Returns:
+                Model: found object
 
+            Raises:
+                Http404: If the id is missing, malformed or unknown.
+            """
+            queryset = self.get_queryset() if queryset is None else queryset
+            id_ = self.request.GET.get('id', None)
+            try:
+                found = queryset.filter(pk=id_).first() if id_ else None
+            except exceptions.ValidationError:
+                found = None
+            if found is None:
+                raise Http404(f'No {context_name} found for the given id.')
+            return found
 
-сlub_view = create_view(Club, 'club', 'entities/club.html')
-boardgame_view = create_view(BoardGame, 'boardgame', 'entities/boardgame.html')
-gameset_view = create_view(GameSet, 'gameset', 'entities/gameset.html')
-address_view = create_view(Address, 'address', 'entities/address.html')
-genre_view = create_view(Genre, 'genre', 'entities/genre.html')
+    return CustomDetailView
+
+
+ClubDetailView = create_detail_view(Club, 'club', 'entities/club.html', only=('id', 'name', 'phone_number'))
+BoardGameDetailView = create_detail_view(BoardGame, 'boardgame', 'entities/boardgame.html', only=('id', 'name', 'level'))
+GameSetDetailView = create_detail_view(GameSet, 'gameset', 'entities/gameset.html', only=('id', 'name', 'description'))
+AddressDetailView = create_detail_view(Address, 'address', 'entities/address.html', only=('id', 'region', 'city', 'street', 'home'))
+GenreDetailView = create_detail_view(Genre, 'genre', 'entities/genre.html', only=('id', 'name', 'description'))
 
 
 def register(request):
@@ -132,14 +158,15 @@ def register(request):
     """
     errors = ''
     if request.method == 'POST':
-        form = Registration(request.POST)
+        form = forms.Registration(request.POST)
         if form.is_valid():
-            user = form.save()
-            Client.objects.create(user=user)
+            with transaction.atomic():
+                user = form.save()
+                Client.objects.create(user=user)
         else:
             errors = form.errors
     else:
-        form = Registration()
+        form = forms.Registration()
 
     return render(
         request,
@@ -151,12 +178,13 @@ def register(request):
     )
 
 
+_SAFE = frozenset(('GET', 'HEAD', 'OPTIONS', 'PATCH'))
+_UNSAFE = frozenset(('POST', 'PUT', 'DELETE'))
+
+
 class MyPermission(permissions.BasePermission):
     """Custom permission class to define permissions based on request method."""
 
-    _safe_methods = 'GET', 'HEAD', 'OPTIONS', 'PATCH'
-    _unsafe_methods = 'POST', 'PUT', 'DELETE'
-
     def has_permission(self, request, _):
         """Check if the request has permission.
 
@@ -167,19 +195,23 @@ class MyPermission(permissions.BasePermission):
         Returns:
             bool: True if request has permission, False otherwise.
         """
-        if request.method in self._safe_methods and (request.user and request.user.is_authenticated):
-            return True
-        if request.method in self._unsafe_methods and (request.user and request.user.is_superuser):
-            return True
+        user = getattr(request, 'user', None)
+        if not user:
+            return False
+        if request.method in _SAFE:
+            return user.is_authenticated
+        if request.method in _UNSAFE:
+            return user.is_superuser
         return False
 
 
-def create_viewset(model_class, serializer):
+def create_viewset(model_class, serializer, prefetch=None):
     """Create a ViewSet class for a given model and serializer.
 
     Args:
         model_class (class): The Django model class to create ViewSet for.
         serializer (Serializer): The DRF serializer class for the model.
+        prefetch (dict): Related models of the many-to-many relations rendered by the serializer as primary keys.
 
     Returns:
         class: Custom ViewSet class for the given model.
@@ -189,18 +221,39 @@ def create_viewset(model_class, serializer):
         """Custom ViewSet class."""
 
         serializer_class = serializer
-        queryset = model_class.objects.all()
+        queryset = model_class.objects.prefetch_related(*(
+            models.Prefetch(name, queryset=related_model.objects.only('id'))
+            for name, related_model in (prefetch or {}).items()
+        ))
         permission_classes = [MyPermission]
-        authentication_classes = [authentication.TokenAuthentication]
+        authentication_classes = [authentication.CachedTokenAuthentication]
 
     return CustomViewSet
 
 
-ClubViewSet = create_viewset(Club, ClubSerializer)
-BoardGameViewSet = create_viewset(BoardGame, BoardGameSerializer)
-GameSetViewSet = create_viewset(GameSet, GameSetSerializer)
-GenreViewSet = create_viewset(Genre, GenreSerializer)
-AddressViewSet = create_viewset(Address, AddressSerializer)
+ClubViewSet = create_viewset(Club, ClubSerializer, prefetch={'games': BoardGame, 'addresses': Address})
+BoardGameViewSet = create_viewset(BoardGame, BoardGameSerializer, prefetch={'genres': Genre, 'clubs': Club})
+GameSetViewSet = create_viewset(GameSet, GameSetSerializer, prefetch={'games': BoardGame})
+GenreViewSet = create_viewset(Genre, GenreSerializer, prefetch={'games': BoardGame})
+AddressViewSet = create_viewset(Address, AddressSerializer, prefetch={'clubs': Club})
+
+
+def join_club(club, client) -> str:
+    """Add a client to a club unless they already joined it.
+
+    Args:
+        club (Club): The club to join.
+        client (Client): The client joining the club.
+
+    Returns:
+        str: form error, empty when the client joined
+    """
+    try:
+        with transaction.atomic():
+            ClubClient.objects.create(club=club, client=client)
+    except IntegrityError:
+        return 'You already joined this club!'
+    return ''
 
 
 @decorators.login_required
@@ -213,32 +266,26 @@ def profile(request):
     Returns:
         HttpResponse: Rendered response of the user profile view.
     """
-    client = Client.objects.get(user=request.user)
+    client = request.client
     form_errors = ''
 
     if request.method == 'POST':
-        form = Join(request.POST)
+        form = forms.Join(request.POST)
         if form.is_valid():
             club = form.cleaned_data.get('club')
             if club:
-                if not ClubClient.objects.filter(club=club, client=client).exists():
-                    ClubClient.objects.create(club=club, client=client)
-                else:
-                    form_errors = 'You already joined this club!'
+                form_errors = join_club(club, client)
             else:
                 form_errors = 'The club is not listed!'
         else:
             form_errors = 'Form validation error!'
     else:
-        form = Join()
+        form = forms.Join()
 
-    client_attrs = ['username', 'first_name', 'last_name']
-    client_data = {attr: getattr(client, attr) for attr in client_attrs}
     return render(
         request,
         'pages/profile.html',
         {
-            'client_data': client_data,
             'form': form,
             'form_errors': form_errors,
             'client_clubs': client.clubs.all(),
@@ -256,22 +303,22 @@ def join(request):
     Returns:
         HttpResponse: Rendered response of the join club view.
     """
-    client = Client.objects.get(user=request.user)
+    client = request.client
     id_ = request.GET.get('id', None)
     if not id_:
         return redirect('clubs')
     try:
-        club = Club.objects.get(id=id_)
-    except (exceptions.ValidationError, exceptions.ObjectDoesNotExist):
+        joined = client.clubs.filter(pk=id_).exists()
+    except exceptions.ValidationError:
         return redirect('clubs')
+    if joined:
+        return redirect('profile')
+    club = Club.objects.filter(pk=id_).first()
     if not club:
         return redirect('clubs')
-    if club in client.clubs.all():
-        return redirect('profile')
 
     if request.method == 'POST':
         client.clubs.add(club)
-        client.save()
         return redirect('profile')
 
     return render(
@@ -294,14 +341,11 @@ def remove_from_joined(request, club_id):
     Returns:
         HttpResponse: Redirects to user profile page after removing the club.
     """
-    client = Client.objects.get(user=request.user)
-    try:
-        club_client = ClubClient.objects.get(client=client, club_id=club_id)
-        club_client.delete()
+    client = request.client
+    deleted, _ = ClubClient.objects.filter(client=client, club_id=club_id).delete()
+    if deleted:
         messages.success(request, 'You have successfully left the club.')
-    except ClubClient.DoesNotExist:
+    else:
         messages.error(request, 'You are not a member of this club.')
-    except Exception as exc:
-        messages.error(request, f'An error occurred: {exc}')
 
     return redirect('profile')
@@ -14,12 +14,15 @@ def prepare_db(self):
         self (class): class
     """
     self.connect()
-    self.connection.cursor().execute('CREATE SCHEMA IF NOT EXISTS game_site;')
+    with self.connection.cursor() as cur:
+        cur.execute('CREATE SCHEMA IF NOT EXISTS game_site;')
 
 
 class PostgresSchemaRunner(DiscoverRunner):
     """Custom Django test runner for PostgreSQL with schema preparation."""
 
+    _patched = set()
+
     def setup_databases(self, **kwargs: Any) -> list[tuple[BaseDatabaseWrapper, str, bool]]:
         """Override to prepare database schemas before setting up databases.
 
@@ -31,5 +34,8 @@ class PostgresSchemaRunner(DiscoverRunner):
         """
         for conn_name in connections:
             connection = connections[conn_name]
+            if connection in self._patched:
+                continue
             connection.prepare_database = MethodType(prepare_db, connection)
+            self._patched.add(connection)
         return super().setup_databases(**kwargs)
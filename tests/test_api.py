@@ -1,12 +1,29 @@
 """Tests for api."""
 
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
-from main_game.models import BoardGame, Club, GameSet
+from main_game.models import Address, BoardGame, Club, GameSet
+
+
+class ApiUsersTest(TestCase):
+    """Test case sharing a user, a superuser and their tokens."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up the users and tokens shared by the tests."""
+        cls.user = User.objects.create(username='abc', password='abc')
+        cls.superuser = User.objects.create(
+            username='admin', password='admin', is_superuser=True,
+        )
+
+        cls.user_token = Token.objects.create(user=cls.user)
+        cls.superuser_token = Token.objects.create(user=cls.superuser)
 
 
 def create_api_test(model, url, creation_attrs):
@@ -20,7 +37,7 @@ def create_api_test(model, url, creation_attrs):
     Returns:
         class: TestCase class containing API test methods.
     """
-    class ApiTest(TestCase):
+    class ApiTest(ApiUsersTest):
         """Test cases for API endpoints related to a specific model.
 
         Args:
@@ -31,14 +48,6 @@ def create_api_test(model, url, creation_attrs):
             """Set up the test environment."""
             self.client = APIClient()
 
-            self.user = User.objects.create(username='abc', password='abc')
-            self.superuser = User.objects.create(
-                username='admin', password='admin', is_superuser=True,
-            )
-
-            self.user_token = Token.objects.create(user=self.user)
-            self.superuser_token = Token.objects.create(user=self.superuser)
-
         def manage(
             self, user: User,
             token: Token,
@@ -94,6 +103,80 @@ def create_api_test(model, url, creation_attrs):
 
 
 url = '/api/'
-ClubApiTest = create_api_test(Club, f'{url}clubs/', {'name': 'abc', 'phone_number': '+79999999999'})
-BoardGameApiTest = create_api_test(BoardGame, f'{url}boardgames/', {'name': 'def', 'level': 1})
-GameSetApiTest = create_api_test(GameSet, f'{url}game_sets/', {'name': 'ghi'})
+club_case = (Club, f'{url}clubs/', {'name': 'abc', 'phone_number': '+79999999999'})
+boardgame_case = (BoardGame, f'{url}boardgames/', {'name': 'def', 'level': 1})
+gameset_case = (GameSet, f'{url}game_sets/', {'name': 'ghi'})
+ClubApiTest = create_api_test(*club_case)
+BoardGameApiTest = create_api_test(*boardgame_case)
+GameSetApiTest = create_api_test(*gameset_case)
+
+
+class AddressApiTest(ApiUsersTest):
+    """Test cases for addresses with optional parts."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.superuser)
+
+    def test_without_street(self):
+        """Test an address without street and home is created once."""
+        address_attrs = {'region': 'r', 'city': 'c'}
+        response = self.client.post(f'{url}addresses/', address_attrs)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(f'{url}addresses/', address_attrs)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Address.objects.count(), 1)
+
+
+class ListQueriesTest(ApiUsersTest):
+    """Test cases for the number of queries of API listings."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def count_queries(self, list_url):
+        """Count the queries of one listing request.
+
+        Args:
+            list_url (str): URL of the listing.
+
+        Returns:
+            int: number of queries
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(list_url)
+            return len(queries)
+
+    def test_list_queries(self):
+        """Test listing does not issue queries per listed object."""
+        for model, list_url, creation_attrs in (club_case, boardgame_case, gameset_case):
+            with self.subTest(model=model.__name__):
+                model.objects.create(**creation_attrs)
+                single = self.count_queries(list_url)
+                model.objects.create(**creation_attrs)
+                model.objects.create(**creation_attrs)
+                self.assertEqual(self.count_queries(list_url), single)
+
+
+class TokenCacheTest(TestCase):
+    """Test cases for cached token authentication."""
+
+    def test_deleted_token(self):
+        """Test a deleted token stops authenticating despite the cache."""
+        user = User.objects.create(username='abc', password='abc')
+        token = Token.objects.create(user=user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(client.get(f'{url}clubs/').status_code, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            token.delete()
+        self.assertEqual(client.get(f'{url}clubs/').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_last_login_keeps_cache(self):
+        """Test recording a login does not look up the user's tokens."""
+        user = User.objects.create(username='abc', password='abc')
+        with self.assertNumQueries(1):
+            user.save(update_fields=['last_login'])
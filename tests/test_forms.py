@@ -1,4 +1,5 @@
 """Tests for forms."""
+from django.core.cache import cache
 from django.test import TestCase
 
 from main_game.forms import Join, Registration
@@ -63,10 +64,14 @@ class TestRegistrationForm(TestCase):
 class TestJoinForm(TestCase):
     """Test cases for the Join form."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the club shared by the tests."""
+        cls.test_club = Club.objects.create(name='test club', phone_number='+79098087060')
+
     def setUp(self):
-        """Set up the test environment."""
-        # Create test data for clubs
-        self.test_club = Club.objects.create(name='test club')
+        """Drop club choices cached by other tests."""
+        cache.clear()
 
     def test_valid_form(self):
         """Test the form with valid club data."""
@@ -99,3 +104,10 @@ class TestJoinForm(TestCase):
         form = Join(data=form_data)
         self.assertFalse(form.is_valid())
         self.assertEqual(form.errors['club'], ['This field is required.'])
+
+    def test_new_club_in_choices(self):
+        """Test a club created after caching the choices is offered."""
+        Join()
+        with self.captureOnCommitCallbacks(execute=True):
+            club = Club.objects.create(name='new club', phone_number='+79098087061')
+        self.assertIn((str(club.id), club.name), Join().fields['club'].choices)
@@ -5,7 +5,7 @@ from django.test import TestCase
 from django.test.client import Client as DjangoTestClient
 from rest_framework import status
 
-from main_game.models import Client, Club
+from main_game.models import Client, Club, ClubClient
 
 club_attrs = {'name': 'DEF', 'phone_number': '+79098087060'}
 
@@ -17,14 +17,17 @@ class JoinTest(TestCase):
 
     _url = '/join/'
     api_client: DjangoTestClient
-    client: Client
+    member: Client
     user: User
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the user and client shared by the tests."""
+        cls.user = User.objects.create(username='user', password='user')
+        cls.member = Client.objects.create(user=cls.user)
+
     def setUp(self):
         """Set up the test environment."""
-        self.user = User.objects.create(username='user', password='user')
-        self.user.save()
-        self.client = Client.objects.create(user=self.user)
         self.api_client = DjangoTestClient()
         self.api_client.force_login(self.user)
 
@@ -40,29 +43,58 @@ class JoinTest(TestCase):
     def test_successful(self):
         """Test successful joining of a club."""
         club = Club.objects.create(**club_attrs)
-        self.client.save()
 
         url = f'{self._url}?id={club.id}'
         self.api_client.post(url, {})
-        self.client.refresh_from_db()
+        self.member.refresh_from_db()
 
-        self.assertIn(club, self.client.clubs.all())
+        self.assertIn(club, self.member.clubs.all())
 
     def test_repeated_join(self):
         """Test attempting to join the same club multiple times."""
         club = Club.objects.create(**club_attrs)
-        self.client.save()
 
         url = f'{self._url}?id={club.id}'
         self.api_client.post(url, {})
-        self.client.refresh_from_db()
+        self.member.refresh_from_db()
 
-        self.assertIn(club, self.client.clubs.all())
+        self.assertIn(club, self.member.clubs.all())
 
         self.api_client.post(url, {})
-        self.client.refresh_from_db()
+        self.member.refresh_from_db()
+
+        self.assertEqual(len(self.member.clubs.filter(id=club.id)), 1)
+
+
+class ProfileJoinTest(TestCase):
+    """Test cases for joining clubs from the profile page."""
+
+    _url = '/profile/'
+    api_client: DjangoTestClient
+    member: Client
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the user and client shared by the tests."""
+        cls.user = User.objects.create(username='user', password='user')
+        cls.member = Client.objects.create(user=cls.user)
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.api_client = DjangoTestClient()
+        self.api_client.force_login(self.user)
 
-        self.assertEqual(len(self.client.clubs.filter(id=club.id)), 1)
+    def test_repeated_join(self):
+        """Test joining the same club twice reports the club as joined."""
+        club = Club.objects.create(**club_attrs)
+
+        response = self.api_client.post(self._url, {'club': club.id})
+        self.assertEqual(response.context['form_errors'], '')
+
+        response = self.api_client.post(self._url, {'club': club.id})
+        self.assertEqual(response.context['form_errors'], 'You already joined this club!')
+        self.assertEqual(ClubClient.objects.filter(club=club, client=self.member).count(), 1)
 
 
 class RemoveFromJoinedTest(TestCase):
@@ -70,29 +102,31 @@ class RemoveFromJoinedTest(TestCase):
 
     _url_template = '/remove_from_joined/{club_id}/'
     api_client: DjangoTestClient
-    client: Client
+    member: Client
     user: User
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the user and client shared by the tests."""
+        cls.user = User.objects.create(username='user', password='user')
+        cls.member = Client.objects.create(user=cls.user)
+
     def setUp(self):
         """Set up the test environment."""
-        self.user = User.objects.create(username='user', password='user')
-        self.user.save()
-        self.client = Client.objects.create(user=self.user)
         self.api_client = DjangoTestClient()
         self.api_client.force_login(self.user)
 
     def test_remove_valid_club(self):
         """Test removing a valid club from joined clubs."""
         club = Club.objects.create(**club_attrs)
-        self.client.clubs.add(club)
-        self.client.save()
+        self.member.clubs.add(club)
 
         url = self._url_template.format(club_id=club.id)
         response = self.api_client.post(url)
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
-        self.client.refresh_from_db()
+        self.member.refresh_from_db()
 
-        self.assertNotIn(club, self.client.clubs.all())
+        self.assertNotIn(club, self.member.clubs.all())
 
     def test_remove_invalid_club(self):
         """Test removing an invalid club ID from joined clubs."""
@@ -107,5 +141,5 @@ class RemoveFromJoinedTest(TestCase):
         response = self.api_client.post(url)
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
 
-        self.client.refresh_from_db()
-        self.assertNotIn(club, self.client.clubs.all())
+        self.member.refresh_from_db()
+        self.assertNotIn(club, self.member.clubs.all())
@@ -1,15 +1,17 @@
 """Tests for models."""
 
+import time
 from datetime import datetime, timezone
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
 from main_game import models
 
 valid_attrs = {
-    'club': {'name': 'ABC', 'phone_number': 'ABC'},
+    'club': {'name': 'ABC', 'phone_number': '+79098087060'},
     'boardgame': {'name': 'ABC', 'level': '99'},
     'genre': {'name': 'ABC', 'description': 'ABC'},
     'address': {'region': 'ABC', 'city': 'ABC', 'street': 'ABC', 'home': 'ABC'},
@@ -18,6 +20,7 @@ valid_attrs = {
 
 TEST_DATE1 = 2007
 TEST_DATE2 = 3000
+UUID_TICK = 0.002
 
 
 def create_model_tests(model_class, creation_attrs):
@@ -75,18 +78,62 @@ class TestLinks(TestCase):
         clubclient_link = models.ClubClient.objects.filter(club=club, client=client)
         self.assertEqual(len(clubclient_link), 1)
 
+    def test_link_str(self):
+        """Test representing a link does not query related objects."""
+        game = models.BoardGame.objects.create(**valid_attrs.get('boardgame'))
+        club = models.Club.objects.create(**valid_attrs.get('club'))
+        club.games.add(game)
+        link = models.ClubToGame.objects.get(club=club, game=game)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(link), f'club {club.id} - game {game.id}')
+        link = models.ClubToGame.objects.select_related('club', 'game').get(club=club, game=game)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(link), f'club {club.name} - game {game.name}')
+
+
+class TestConstraints(TestCase):
+    """Test cases for database constraints."""
+
+    def test_level_range(self):
+        """Test a board game level above the maximum is rejected."""
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                models.BoardGame.objects.create(name='ABC', level=models.LEVEL_MAX + 1)
+
+    def test_phone_number_format(self):
+        """Test a club phone number in a wrong format is rejected."""
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                models.Club.objects.create(name='ABC', phone_number='ABC')
+
+    def test_address_unique(self):
+        """Test an address without street and home is stored once."""
+        models.Address.objects.create(region='ABC', city='ABC')
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                models.Address.objects.create(region='ABC', city='ABC')
+
+
+class TestUUID7(TestCase):
+    """Test cases for time-ordered primary keys."""
+
+    def test_version(self):
+        """Test the generated UUID has version 7."""
+        self.assertEqual(models.uuid7().version, 7)
+
+    def test_time_ordered(self):
+        """Test UUIDs generated later compare greater."""
+        first = models.uuid7()
+        time.sleep(UUID_TICK)
+        self.assertLess(first, models.uuid7())
+
 
 valid_tests = (
-    (models.check_created, datetime(TEST_DATE1, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
-    (models.check_modified, datetime(TEST_DATE1, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
-    (models.check_level, 30),
+    (models.check_not_future, datetime(TEST_DATE1, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
     (models.phone_number_validator, '+79098087060'),
 )
 invalid_tests = (
-    (models.check_created, datetime(TEST_DATE2, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
-    (models.check_modified, datetime(TEST_DATE2, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
-    (models.check_level, 3000),
-    (models.check_level, -3),
+    (models.check_not_future, datetime(TEST_DATE2, 1, 1, 1, 1, 1, 1, tzinfo=timezone.utc)),
     (models.phone_number_validator, '+7909ee8087060'),
     (models.phone_number_validator, '+790980870600'),
     (models.phone_number_validator, '79098087060'),
@@ -0,0 +1,49 @@
+"""Tests for paginators."""
+from django.core.cache import cache
+from django.test import TestCase
+
+from main_game.models import Club
+from main_game.paginators import CachedCountPaginator, PkSlicePaginator
+
+PER_PAGE = 2
+
+
+class TestPkSlicePaginator(TestCase):
+    """Test cases for the primary key slicing paginator."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the clubs shared by the tests."""
+        for name in ('A', 'B', 'C', 'D', 'E'):
+            Club.objects.create(name=name, phone_number='+79098087060')
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.paginator = PkSlicePaginator(Club.objects.order_by('name', 'pk'), PER_PAGE)
+
+    def test_pages(self):
+        """Test pages keep the queryset order."""
+        names = [[club.name for club in self.paginator.page(number)] for number in self.paginator.page_range]
+        self.assertEqual(names, [['A', 'B'], ['C', 'D'], ['E']])
+
+    def test_orphans(self):
+        """Test orphans are merged into the last page."""
+        paginator = PkSlicePaginator(Club.objects.order_by('name', 'pk'), PER_PAGE, orphans=1)
+        self.assertEqual([club.name for club in paginator.page(2)], ['C', 'D', 'E'])
+
+
+class TestCachedCountPaginator(TestCase):
+    """Test cases for the cached count paginator."""
+
+    def setUp(self):
+        """Drop counts cached by other tests."""
+        cache.clear()
+
+    def test_count_refreshed(self):
+        """Test a created row is counted by the next paginator."""
+        paginator = CachedCountPaginator(Club.objects.order_by('name', 'pk'), PER_PAGE)
+        self.assertEqual(paginator.count, Club.objects.count())
+        with self.captureOnCommitCallbacks(execute=True):
+            Club.objects.create(name='A', phone_number='+79098087060')
+        paginator = CachedCountPaginator(Club.objects.order_by('name', 'pk'), PER_PAGE)
+        self.assertEqual(paginator.count, Club.objects.count())
@@ -1,5 +1,6 @@
 """Tests for views."""
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.client import Client
 from django.urls import reverse
@@ -7,6 +8,14 @@ from rest_framework import status
 
 from main_game import models
 
+club_attrs = {'name': 'name', 'phone_number': '+79098087060'}
+entity_pages = {
+    'join': (models.Club, club_attrs),
+    'club': (models.Club, club_attrs),
+    'boardgame': (models.BoardGame, {'name': 'name', 'level': 1}),
+    'address': (models.Address, {'region': 'region', 'city': 'city'}),
+}
+
 
 def create_successful_page_test(page_url, page_name, template, auth=True):
     """Create a test function for successful page access.
@@ -28,14 +37,14 @@ def create_successful_page_test(page_url, page_name, template, auth=True):
         """
         self.client = Client()
         if auth:
-            user = User.objects.create(username='user', password='user')
-            models.Client.objects.create(user=user)
-            self.client.force_login(user)
+            self.client.force_login(self.user)
 
         reversed_url = reverse(page_name)
-        if page_name == 'join':
-            club = models.Club.objects.create(name='name', phone_number='+79098087060')
-            url, reversed_url = f'{page_url}?id={club.id}', f'{reversed_url}?id={club.id}'
+        entity_page = entity_pages.get(page_name)
+        if entity_page:
+            model_class, creation_attrs = entity_page
+            entity = model_class.objects.create(**creation_attrs)
+            url, reversed_url = f'{page_url}?id={entity.id}', f'{reversed_url}?id={entity.id}'
         else:
             url = page_url
 
@@ -72,6 +81,16 @@ def create_redirect_page_test(page_name):
     return test
 
 
+def set_up_user(cls):
+    """Create the user and client shared by the tests of a class.
+
+    Args:
+        cls (class): test case class
+    """
+    cls.user = User.objects.create(username='user', password='user')
+    models.Client.objects.create(user=cls.user)
+
+
 auth_pages = (
     ('/clubs/', 'clubs', 'catalog/clubs.html'),
     ('/boardgames/', 'boardgames', 'catalog/boardgames.html'),
@@ -90,10 +109,61 @@ casual_pages = (
 )
 
 casual_methods = {f'test_{page[1]}': create_successful_page_test(*page) for page in casual_pages}
+casual_methods['setUpTestData'] = classmethod(set_up_user)
 TestCasualPages = type('TestCasualPages', (TestCase,), casual_methods)
 
 auth_pages_methods = {f'test_{page[1]}': create_successful_page_test(*page) for page in auth_pages}
+auth_pages_methods['setUpTestData'] = classmethod(set_up_user)
 TestAuthPages = type('TestAuthPages', (TestCase,), auth_pages_methods)
 
 no_auth_pages_methods = {f'test_{page}': create_redirect_page_test(page) for _, page, _ in auth_pages}
 TestNoAuthPages = type('TestNoAuthPages', (TestCase,), no_auth_pages_methods)
+
+
+class TestHomeCounts(TestCase):
+    """Test cases for the cached homepage counts."""
+
+    def setUp(self):
+        """Drop counts cached by other tests."""
+        cache.clear()
+
+    def test_count_refreshed(self):
+        """Test a created club is counted on the next homepage visit."""
+        self.client.get(reverse('homepage'))
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Club.objects.create(name='name', phone_number='+79098087060')
+        response = self.client.get(reverse('homepage'))
+        self.assertEqual(response.context['clubs'], models.Club.objects.count())
+
+    def test_counts_single_query(self):
+        """Test counts missing from the cache are fetched in one query."""
+        with self.assertNumQueries(1):
+            self.client.get(reverse('homepage'))
+
+
+class TestMissingEntity(TestCase):
+    """Test cases for entity pages of missing objects."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the user shared by the tests."""
+        cls.user = User.objects.create(username='user', password='user')
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client.force_login(self.user)
+
+    def test_unknown_id(self):
+        """Test an unknown id responds with not found."""
+        response = self.client.get(reverse('club'), {'id': '00000000-0000-0000-0000-000000000000'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_id(self):
+        """Test a malformed id responds with not found."""
+        response = self.client.get(reverse('club'), {'id': '123'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_missing_id(self):
+        """Test a request without an id responds with not found."""
+        response = self.client.get(reverse('club'))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)